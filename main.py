@@ -1,58 +1,439 @@
-from PIL import Image
+from PIL import Image, ImageSequence
+import functools
+import multiprocessing
 import os
 import argparse
+import collections
+import queue
 import sys # Added for sys.exit
+import threading
+import time
 
-def get_ascii_char(pixel_intensity, char_set):
-    """Maps a pixel intensity (0-255) to an ASCII character.
-    The char_set should be ordered from brightest to darkest for typical dark-on-light terminal backgrounds.
-    E.g., ' .:-=+*#%@' means ' ' is brightest (for black pixels) and '@' is darkest (for white pixels).
-    """
-    index = int(pixel_intensity / 256 * len(char_set))
-    return char_set[index]
+# NumPy is optional. Color output, batch conversion and the optional Numba and OpenCV backends
+# for multi-frame sources need it; plain image_to_ascii() does not.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def image_to_ascii(image_path, output_width=100, char_set=' .:-=+*#%@'):
+def image_to_ascii(image_path, output_width=100, char_set=' .:-=+*#%@', as_bytes=False):
     """Converts an image to ASCII art string.
     
     Args:
         image_path (str): Path to the image file.
         output_width (int): Desired width of the ASCII art output in characters.
         char_set (str): String of characters to use for ASCII art, ordered brightest to darkest.
+            E.g., ' .:-=+*#%@' means ' ' is used for black pixels and '@' for white pixels.
+        as_bytes (bool): Return UTF-8 encoded bytes instead of str, skipping the decode step.
+            Useful when the result is written straight to a binary stream.
 
     Returns:
-        str: The ASCII art representation of the image, or an error message.
+        str | bytes | bytearray: The ASCII art representation of the image, or an error message.
     """
-    if not os.path.exists(image_path):
-        # This check is now also done in the main block before calling, but kept for function robustness.
-        return f"Error: Image '{image_path}' not found."
+    image, error = _open_image(image_path)
+    if error:
+        return error.encode() if as_bytes else error
+
+    # Size the art from the original dimensions: draft() below rounds the decoded size, which
+    # would otherwise change the row count.
+    size = _target_size(*image.size, output_width)
+    # For JPEGs, draft() lets the decoder downscale and convert to grayscale itself.
+    image.draft('L', (size[0] * 2, size[1] * 2))
+    art = _grayscale_to_ascii(_resize_grayscale(image, size), char_set)
+    return art if as_bytes else art.decode('utf-8')
+
+def image_to_color_ascii(image_path, output_width=100, char_set=' .:-=+*#%@', as_bytes=False):
+    """Converts an image to ASCII art colored with 24-bit ANSI escape codes.
+
+    Each character is picked from the pixel's luma, as in image_to_ascii, and drawn in the
+    pixel's original color. Requires NumPy.
+
+    Args:
+        image_path (str): Path to the image file.
+        output_width (int): Desired width of the ASCII art output in characters.
+        char_set (str): String of characters to use for ASCII art, ordered brightest to darkest.
+        as_bytes (bool): Return encoded bytes instead of str.
+
+    Returns:
+        str | bytes: The colored ASCII art representation of the image, or an error message.
+    """
+    if np is None:
+        error = "Error: Color output requires NumPy: pip install numpy"
+        return error.encode() if as_bytes else error
+
+    image, error = _open_image(image_path)
+    if error:
+        return error.encode() if as_bytes else error
 
+    image = image.convert('RGB').resize(_target_size(*image.size, output_width), Image.BILINEAR, reducing_gap=2.0)
+
+    # Split into planar R, G, B arrays so every step below is a whole-plane NumPy operation
+    rgb = np.asarray(image)
+    r, g, b = (np.ascontiguousarray(rgb[..., c]) for c in range(3))
+
+    # Integer-weighted ITU-R 601 luma; the weights sum to 256 so the result stays in 0-255.
+    # Accumulate in place to avoid a temporary per channel cast and per partial sum.
+    luma = np.multiply(r, 77, dtype=np.uint16)
+    luma += np.multiply(g, 150, dtype=np.uint16)
+    luma += np.multiply(b, 29, dtype=np.uint16)
+    luma >>= 8
+
+    # Every cell is '\x1b[38;2;RRR;GGG;BBBm' + char. Zero-padding the color values (which
+    # terminals accept) gives all cells the same width, so the whole frame is assembled by
+    # gathering from byte tables into one uint8 array, with a color reset + newline per row.
+    chars, padded = _char_cells(char_set)
+    digits = _ansi_digits()
+    height, width = luma.shape
+    cell = 19 + chars.shape[1]
+    out = np.empty((height, width * cell + 5), dtype=np.uint8)
+    out[:, -5:] = np.frombuffer(b'\x1b[0m\n', dtype=np.uint8)
+    cells = out[:, :-5].view()
+    cells.shape = (height, width, cell)  # Raises rather than silently copying
+    cells[..., 0:7] = np.frombuffer(b'\x1b[38;2;', dtype=np.uint8)
+    cells[..., 7:10] = digits[r]
+    cells[..., 10] = ord(';')
+    cells[..., 11:14] = digits[g]
+    cells[..., 14] = ord(';')
+    cells[..., 15:18] = digits[b]
+    cells[..., 18] = ord('m')
+    cells[..., 19:] = chars[luma]
+
+    art = out.tobytes()
+    if padded:
+        art = art.replace(b'\0', b'')
+    return art if as_bytes else art.decode('utf-8')
+
+@functools.lru_cache(maxsize=None)
+def _ansi_digits():
+    """Returns a (256, 3) uint8 table of the zero-padded decimal digits of every channel value."""
+    return np.frombuffer(''.join(f'{i:03d}' for i in range(256)).encode('ascii'), dtype=np.uint8).reshape(256, 3)
+
+def frames_to_ascii(image_path, output_width=100, char_set=' .:-=+*#%@', as_bytes=False):
+    """Converts every frame of a multi-frame image (e.g. an animated GIF) to ASCII art.
+
+    Frames are independent, so they are converted in parallel by a process pool. Results are
+    yielded in frame order as soon as they are ready, so playback can start before the whole
+    animation has been converted. Only a few frames per worker are decoded ahead of the
+    consumer, so memory use does not grow with the length of the animation.
+
+    The pool uses the 'spawn' start method, which re-imports the calling script in every worker.
+    Scripts that call this function must therefore guard their entry point with
+    ``if __name__ == '__main__':``.
+
+    Args:
+        image_path (str): Path to the image file.
+        output_width (int): Desired width of the ASCII art output in characters.
+        char_set (str): String of characters to use for ASCII art, ordered brightest to darkest.
+        as_bytes (bool): Yield UTF-8 encoded bytes instead of str.
+
+    Yields:
+        str | bytes | bytearray: The ASCII art representation of each frame, or a single error message.
+    """
+    image, error = _open_image(image_path)
+    if error:
+        yield error.encode() if as_bytes else error
+        return
+
+    workers = os.cpu_count()
+    with image:
+        # Spawn rather than fork: forking after Numba's or OpenCV's thread pools have started
+        # leaves the children (and the interpreter at exit) deadlocked.
+        with multiprocessing.get_context('spawn').Pool(workers, initializer=_init_frame_worker) as pool:
+            # Pool.imap would drain the frame iterator up front, so submit frames through a
+            # bounded window instead and decode the next one only when a result is taken.
+            pending = collections.deque()
+            for frame in ImageSequence.Iterator(image):
+                # Frames are shipped to the workers as raw grayscale bytes, which is the cheapest
+                # form to pickle and the first thing the conversion does anyway.
+                args = (frame.size, frame.convert('L').tobytes(), output_width, char_set)
+                pending.append(pool.apply_async(_frame_worker, (args,)))
+                if len(pending) > workers * 4:
+                    art = pending.popleft().get()
+                    yield art if as_bytes else art.decode('utf-8')
+            while pending:
+                art = pending.popleft().get()
+                yield art if as_bytes else art.decode('utf-8')
+
+def animate(image_path, output_width=100, char_set=' .:-=+*#%@'):
+    """Plays a multi-frame image (e.g. an animated GIF) as ASCII art in the terminal.
+
+    The file is opened once and frames are decoded lazily. A background thread decodes and
+    resizes the next frame while the current one is on screen, and each frame is held for its
+    own duration.
+
+    Args:
+        image_path (str): Path to the image file.
+        output_width (int): Desired width of the ASCII art output in characters.
+        char_set (str): String of characters to use for ASCII art, ordered brightest to darkest.
+
+    Returns:
+        str | None: An error message, or None once playback has finished.
+    """
+    image, error = _open_image(image_path)
+    if error:
+        return error
+
+    frames = queue.Queue(maxsize=2)
+
+    # The character mapping stays on the main thread: Numba's parallel threading layers are not
+    # safe to launch from a second thread, and the mapping is cheap next to decoding anyway.
+    def decode_frames():
+        error = None
+        try:
+            with image:
+                for frame in ImageSequence.Iterator(image):
+                    size = _target_size(*frame.size, output_width)
+                    resized = _resize_grayscale(frame, size, multi_frame=True)
+                    frames.put((resized, frame.info.get('duration', 100)))
+        except Exception as e:
+            error = f"Error decoding frame: {e}"
+        finally:
+            # Tell the player there are no more frames, passing on the error if decoding failed
+            frames.put(error)
+
+    threading.Thread(target=decode_frames, daemon=True).start()
+
+    out = sys.stdout.buffer
+    sys.stdout.flush()
+    out.write(b'\x1b[2J')  # Clear the screen once; each frame then redraws from the top-left corner
+    next_frame = time.monotonic()
+    while True:
+        item = frames.get()
+        if item is None or isinstance(item, str):
+            return item
+        frame, duration = item
+        art = _grayscale_to_ascii(frame, char_set, multi_frame=True)
+        time.sleep(max(0, next_frame - time.monotonic()))
+        out.write(b'\x1b[H' + art)
+        out.flush()
+        next_frame = time.monotonic() + duration / 1000
+
+def images_to_ascii(image_paths, output_width=100, char_set=' .:-=+*#%@', as_bytes=False):
+    """Converts a batch of images to ASCII art of one common size. Requires NumPy.
+
+    All images are resized to the size of the first one and stacked into a single
+    (images, rows, columns) array, so the character lookup runs once over the whole batch.
+
+    Args:
+        image_paths (list): Paths to the image files.
+        output_width (int): Desired width of the ASCII art output in characters.
+        char_set (str): String of characters to use for ASCII art, ordered brightest to darkest.
+        as_bytes (bool): Return UTF-8 encoded bytes instead of str.
+
+    Returns:
+        list | str | bytes: The ASCII art of each image in order, or an error message.
+    """
+    if np is None:
+        error = "Error: Batch conversion requires NumPy: pip install numpy"
+        return error.encode() if as_bytes else error
+
+    size = None
+    cube = None
+    for i, image_path in enumerate(image_paths):
+        image, error = _open_image(image_path)
+        if error:
+            return error.encode() if as_bytes else error
+
+        with image:
+            if size is None:
+                size = _target_size(*image.size, output_width)
+                cube = np.empty((len(image_paths), size[1], size[0]), dtype=np.uint8)
+            # For JPEGs, draft() lets the decoder downscale and convert to grayscale itself.
+            image.draft('L', (size[0] * 2, size[1] * 2))
+            cube[i] = np.asarray(_resize_grayscale(image, size, multi_frame=True))
+
+    if cube is None:
+        return []
+
+    # One lookup over the whole batch, written next to a preset newline column
+    cells, padded = _char_cells(char_set)
+    count, rows, columns = cube.shape
+    row_bytes = columns * cells.shape[1]
+    out = np.full((count, rows, row_bytes + 1), ord('\n'), dtype=np.uint8)
+    out[:, :, :row_bytes] = cells[cube].reshape(count, rows, row_bytes)
+
+    arts = [art.tobytes() for art in out]
+    if padded:
+        arts = [art.replace(b'\0', b'') for art in arts]
+    return arts if as_bytes else [art.decode('utf-8') for art in arts]
+
+def _init_frame_worker():
+    """Pool initializer for frames_to_ascii: limits each worker to a single thread.
+
+    The pool already runs one process per core, so letting Numba's parallel kernel and OpenCV's
+    resize start their own thread pools in every worker would oversubscribe the CPU.
+    """
+    try:
+        import numba
+    except ImportError:
+        pass
+    else:
+        numba.set_num_threads(1)
+    cv2 = _opencv()
+    if cv2 is not None:
+        cv2.setNumThreads(1)
+
+def _frame_worker(args):
+    """Pool worker for frames_to_ascii: rebuilds a grayscale frame and converts it."""
+    size, data, output_width, char_set = args
+    image = Image.frombytes('L', size, data)
+    image = _resize_grayscale(image, _target_size(*size, output_width), multi_frame=True)
+    return _grayscale_to_ascii(image, char_set, multi_frame=True)
+
+def _open_image(image_path):
+    """Opens an image file.
+
+    Returns:
+        tuple: (image, None) on success, or (None, error message) on failure.
+    """
+    # Let open() report a missing file instead of checking os.path.exists() first: that saves
+    # a stat per call and avoids the file disappearing between the check and the open.
     try:
-        image = Image.open(image_path)
+        return Image.open(image_path), None
+    except FileNotFoundError:
+        return None, f"Error: Image '{image_path}' not found."
     except Exception as e:
-        return f"Error opening image: {e}"
+        return None, f"Error: Could not open image: {e}"
 
-    # Calculate aspect ratio and new height. Terminal characters are typically taller than wide,
-    # so we adjust the height to prevent the image from looking stretched.
-    width, height = image.size
+@functools.lru_cache(maxsize=64)
+def _target_size(width, height, output_width):
+    """Returns the (columns, rows) size of the ASCII art for a width x height source image.
+
+    Cached because every frame of an animation has the same source size.
+    """
+    # Terminal characters are typically taller than wide, so we adjust the height to prevent
+    # the image from looking stretched.
     aspect_ratio = height / width
-    output_height = int(output_width * aspect_ratio * 0.55) # 0.55 is an approximate terminal character aspect ratio
+    return output_width, int(output_width * aspect_ratio * 0.55) # 0.55 is an approximate terminal character aspect ratio
+
+@functools.lru_cache(maxsize=8)
+def _char_table(char_set):
+    """Returns a 256-entry table mapping every pixel intensity (0-255) to its character.
+
+    The table is bytes (for bytes.translate) when every character is ASCII, and a str (for
+    str.translate on the latin-1 decoded intensities) otherwise. Cached because animations and
+    repeated conversions reuse the same char_set for every frame.
+    """
+    # (i * len) >> 8 is the integer form of int(i / 256 * len)
+    n = len(char_set)
+    table = ''.join(char_set[(i * n) >> 8] for i in range(256))
+    return table.encode('ascii') if table.isascii() else table
+
+@functools.lru_cache(maxsize=8)
+def _char_cells(char_set):
+    """Returns the character table as a NumPy array for the vectorized paths.
 
-    # Resize image and convert to grayscale ('L' mode)
-    image = image.resize((output_width, output_height))
-    image = image.convert('L') 
+    Returns:
+        tuple: A (256, width) uint8 array holding each character's UTF-8 bytes, NUL-padded to
+            the widest character, and whether any padding had to be added.
+    """
+    table = _char_table(char_set)
+    chars = [c.encode('utf-8') for c in (table.decode('ascii') if isinstance(table, bytes) else table)]
+    width = max(len(c) for c in chars)
+    cells = np.frombuffer(b''.join(c.ljust(width, b'\0') for c in chars), dtype=np.uint8)
+    return cells.reshape(256, width), any(len(c) < width for c in chars)
+
+@functools.lru_cache(maxsize=None)
+def _opencv():
+    """Returns the cv2 module, or None if OpenCV (or NumPy) is not installed.
+
+    Imported on first use: its SIMD-optimized resize only adds up over many frames, so single
+    images never pay for loading it.
+    """
+    if np is None:
+        return None
+    try:
+        import cv2
+    except ImportError:
+        return None
+    return cv2
+
+def _resize_grayscale(image, size, multi_frame=False):
+    """Returns the image as a grayscale ('L' mode) image of the given (columns, rows) size.
+
+    multi_frame allows the optional OpenCV resize, which is only worth loading for animations
+    and batches.
+    """
+    # Convert to grayscale ('L' mode) before resizing so only one channel is resampled.
+    # Skip the conversion when the source is already grayscale (drafted JPEGs, pool frames),
+    # since convert() would otherwise materialize a full-size copy.
+    if image.mode != 'L':
+        image = image.convert('L')
+    cv2 = _opencv() if multi_frame else None
+    if cv2 is not None:
+        # INTER_AREA is a true box filter, the best quality for large downscales like this one
+        arr = cv2.resize(np.asarray(image), size, interpolation=cv2.INTER_AREA)
+        return Image.fromarray(arr, mode='L')
+
+    # Bilinear with a reducing gap is plenty for character-cell resolution and much cheaper
+    # than the default bicubic filter.
+    return image.resize(size, Image.BILINEAR, reducing_gap=2.0)
+
+@functools.lru_cache(maxsize=None)
+def _ascii_kernel():
+    """Returns the Numba pixel-to-character kernel, or None if Numba is not installed.
+
+    Numba is imported and the kernel compiled on first use, so single images never pay for it;
+    the parallel kernel only pays off over the many frames of an animation.
+    """
+    if np is None:
+        return None
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def kernel(arr, lut, out):
+        """Writes lut[arr[y, x]] into out[y, x]. out has one extra column pre-filled with newlines."""
+        height, width = arr.shape
+        for y in prange(height):
+            for x in range(width):
+                out[y, x] = lut[arr[y, x]]
+
+    return kernel
+
+def _grayscale_to_ascii(image, char_set, multi_frame=False):
+    """Maps every pixel of a resized grayscale image to a character, one row per line.
+
+    multi_frame allows the optional Numba kernel, which is only worth loading for animations.
+    The result is bytes-like (bytes or bytearray) and is returned without a final copy.
+    """
+    output_width, output_height = image.size
+    table = _char_table(char_set)
+
+    if isinstance(table, str):
+        # Non-ASCII character set: latin-1 turns each intensity byte into the code point of the
+        # same value, so str.translate can apply the table in one C loop.
+        text = image.tobytes().decode('latin-1').translate(table)
+        rows = [text[y * output_width:(y + 1) * output_width] + '\n' for y in range(output_height)]
+        return ''.join(rows).encode('utf-8')
+
+    kernel = _ascii_kernel() if multi_frame else None
+    if kernel is not None:
+        # Let the kernel write straight into the returned buffer
+        buf = bytearray(b'\n' * ((output_width + 1) * output_height))
+        out = np.frombuffer(buf, dtype=np.uint8).reshape(output_height, output_width + 1)
+        kernel(np.asarray(image, dtype=np.uint8), np.frombuffer(table, dtype=np.uint8), out)
+        return buf
 
-    pixels = image.getdata()
-    ascii_art_chars = []
-    for i, pixel_intensity in enumerate(pixels):
-        ascii_art_chars.append(get_ascii_char(pixel_intensity, char_set))
-        if (i + 1) % output_width == 0: # Add a newline after each row
-            ascii_art_chars.append('\n')
-    return "".join(ascii_art_chars)
+    # bytes.translate() applies the 256-byte table in a single C loop over the raw intensities
+    chars = image.tobytes().translate(table)
+
+    # Copy each row into a single preallocated buffer whose last column is already '\n'
+    stride = output_width + 1
+    out = bytearray(b'\n' * (stride * output_height))
+    mv = memoryview(chars)
+    for y in range(output_height):
+        out[y * stride:y * stride + output_width] = mv[y * output_width:(y + 1) * output_width]
+    return out
 
 if __name__ == "__main__":
     # Usage: python main.py <path_to_image.jpg>
     parser = argparse.ArgumentParser(description='Convert an image to ASCII art and display it in the terminal.')
     parser.add_argument('image_path', help='Path to the input image file (e.g., image.jpg)')
+    parser.add_argument('--color', action='store_true', help='Color the output with ANSI escape codes (requires NumPy)')
+    parser.add_argument('--animate', action='store_true', help='Play a multi-frame image (e.g. an animated GIF) as an animation')
     args = parser.parse_args()
 
     # Implement basic error handling
@@ -71,17 +452,32 @@ if __name__ == "__main__":
 
     # The auto-download logic is removed as the user is expected to provide an existing image path.
 
+    if args.animate:
+        error = animate(image_file, output_width=80)
+        if error:
+            print(error)
+            sys.exit(1)
+        sys.exit(0)
+
     print(f"Converting '{image_file}' to ASCII art...")
     # Adjust output_width for your terminal size for best results.
     # Common values are 80-120 characters.
-    art = image_to_ascii(image_file, output_width=80)
+    if args.color:
+        art = image_to_color_ascii(image_file, output_width=80, as_bytes=True)
+    else:
+        art = image_to_ascii(image_file, output_width=80, as_bytes=True)
     
     # Check if image_to_ascii returned an error message
-    if art.startswith("Error:"):
-        print(art)
+    if art.startswith(b"Error:"):
+        print(art.decode())
         sys.exit(1)
     else:
-        print(art)
+        # Write the raw bytes straight to stdout instead of decoding and re-encoding through print().
+        # Flush first so the text written by print() above comes out before the art.
+        sys.stdout.flush()
+        sys.stdout.buffer.write(art)
+        sys.stdout.buffer.write(b'\n')
+        sys.stdout.flush()
 
     print("\n--- AsciiArtAnimator ---\n")
     print("This is just the beginning! Here are some ideas to expand this project:")